@@ -9,6 +9,10 @@ from PySide6.QtWidgets import (QDialog, QLabel, QVBoxLayout, QPushButton, QHBoxL
 from PySide6.QtCore import Qt, QThread, Signal
 import sys
 import os
+import time
+
+# File extensions that get exported (lowercase, without the dot)
+_IMAGE_EXT_SET = frozenset(('png', 'jpg', 'jpeg', 'bmp', 'gif', 'tiff'))
 
 # Add project root to path for imports
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -43,12 +47,9 @@ except ImportError as e:
         def get_all_files_in_directory(path):
             if not os.path.exists(path):
                 return []
-            files = []
-            for file in os.listdir(path):
-                file_path = os.path.join(path, file)
-                if os.path.isfile(file_path):
-                    files.append(file_path)
-            return files
+            # scandir reports the entry type without a stat per file
+            with os.scandir(path) as entries:
+                return [entry.path for entry in entries if entry.is_file()]
     
     get_all_files_in_directory = DummyGetAllFiles()
     
@@ -67,6 +68,8 @@ except ImportError as e:
 import json
 import shutil
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 class FolderPreviewWidget(QGroupBox):
     """Widget for previewing and managing export categories"""
@@ -143,12 +146,24 @@ class ExportWorker(QThread):
         self.categories = categories
         self.quality_check = quality_check
         
+    @staticmethod
+    def _quality_results(executor, image_files, lookahead, pending):
+        """Yield the quality check of each image in order, with at most lookahead checks queued in pending."""
+        for img_path in image_files:
+            pending.append(executor.submit(check_image_quality, img_path))
+            if len(pending) >= lookahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
     def run(self):
         """Run the export process in a separate thread"""
+        executor = None
+        pending = deque()  # Submitted quality checks whose results haven't been used yet
         try:
             # Get all image files
             all_files = get_all_files_in_directory.get_all_files_in_directory(self.source_dir)
-            image_files = [f for f in all_files if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff'))]
+            image_files = [f for f in all_files if f.rpartition('.')[2].lower() in _IMAGE_EXT_SET]
             
             if not image_files:
                 self.error.emit("No image files found in the source directory.")
@@ -169,12 +184,31 @@ class ExportWorker(QThread):
                 'by_category': {}
             }
             
+            # Run the quality checks on a thread pool (OpenCV releases the GIL while it works);
+            # results come back in order so copying stays sequential, and only a few checks
+            # are queued ahead so little work is left over if the export stops early
+            if self.quality_check:
+                workers = os.cpu_count() or 4
+                executor = ThreadPoolExecutor(max_workers=workers)
+                quality_results = self._quality_results(executor, image_files, workers * 2, pending)
+            
+            # Signals are queued to the GUI thread; send at most one status per 100 ms
+            # and one progress value per percent instead of two events per image
+            last_status_time = 0.0
+            last_percent = -1
+            
             for i, img_path in enumerate(image_files):
-                self.status.emit(f"Processing {os.path.basename(img_path)}...")
+                if self.isInterruptionRequested():
+                    return  # Cancelled from the dialog
+                
+                now = time.monotonic()
+                if now - last_status_time >= 0.1:
+                    self.status.emit(f"Processing {os.path.basename(img_path)}...")
+                    last_status_time = now
                 
                 # Check image quality if enabled
                 if self.quality_check:
-                    quality, score, dimensions = check_image_quality(img_path)
+                    quality, score, dimensions = next(quality_results)
                     if quality == "error":
                         stats['errors'] += 1
                         continue
@@ -214,12 +248,21 @@ class ExportWorker(QThread):
                 
                 # Update progress
                 progress_percent = int((i + 1) / len(image_files) * 100)
-                self.progress.emit(progress_percent)
+                if progress_percent != last_percent:
+                    self.progress.emit(progress_percent)
+                    last_percent = progress_percent
             
             self.finished.emit(stats)
             
         except Exception as e:
             self.error.emit(str(e))
+        finally:
+            # Drop the checks that haven't started; running ones finish on their own.
+            # (shutdown's cancel_futures needs Python 3.9, setup.py allows 3.8)
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
 
 class ExportDialog(QDialog):
     def __init__(self, parent=None, source_directory=None):
@@ -482,7 +525,8 @@ class ExportDialog(QDialog):
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                self.export_worker.terminate()
+                # Stop after the current image so the worker can shut its thread pool down
+                self.export_worker.requestInterruption()
                 self.export_worker.wait()
                 self.reset_ui()
                 self.reject()
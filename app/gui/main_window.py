@@ -2,6 +2,10 @@
 import sys
 import os
 import shutil
+import hashlib
+import tempfile
+import time
+from pathlib import Path
 
 # Add the project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,9 +14,10 @@ sys.path.insert(0, project_root)
 from PySide6.QtWidgets import (QApplication, QRadioButton, QButtonGroup, QGroupBox, QFrame, QFileDialog,
                                QMainWindow, QLabel, QScrollArea, QGridLayout, QWidget, QHBoxLayout, 
                                QVBoxLayout, QSlider, QDialog, QPushButton, QCheckBox, QMessageBox)
-from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtCore import Qt, Signal, QEvent
+from PySide6.QtGui import QPixmap, QIcon, QImage, QPainter, QImageReader, QPixmapCache
+from PySide6.QtCore import Qt, Signal, QEvent, QRect, QSize, QThread, QObject, QRunnable, QThreadPool, QTimer
 from pprint import pformat
+from functools import lru_cache
 
 # Import using absolute imports with error handling
 try:
@@ -23,12 +28,9 @@ try:
             """Get all files in directory - fallback implementation"""
             if not os.path.exists(path):
                 return []
-            files = []
-            for file in os.listdir(path):
-                file_path = os.path.join(path, file)
-                if os.path.isfile(file_path):
-                    files.append(file_path)
-            return files
+            # scandir reports the entry type without a stat per file
+            with os.scandir(path) as entries:
+                return [entry.path for entry in entries if entry.is_file()]
         
         @staticmethod
         def get_image_metadata(path):
@@ -153,28 +155,268 @@ except ImportError as e:
     print(f"Some imports failed: {e}")
     print("Running with limited functionality")
 
+# Move deleted files to the recycle bin when send2trash is installed
+try:
+    from send2trash import send2trash
+except ImportError:
+    send2trash = None
+
+# Faster non-cryptographic hash for thumbnail file names when xxhash is installed
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# Tag radio button names, sorted alphabetically with 'Unknown' last
+_TAG_NAMES = tuple(sorted(['Animal', 'Cat', 'Dog', 'Person', 'Vehicle', 'Kitchenware',
+                           'Appliance', 'Entertainment\n Device'])) + ('Unknown',)
+
+# Output folder name of each tag, indexed by the tag button's id (multi-line names joined with '_')
+_TAG_FOLDER_NAMES = tuple(name.replace('\n', '_') for name in _TAG_NAMES)
+
+# Size radio button names, in button id order
+_SIZE_NAMES = ('Small', 'Medium', 'Large')
+
+# File extensions shown in the image grid (lowercase, without the dot)
+_IMAGE_EXT_SET = frozenset(('png', 'jpg', 'jpeg', 'bmp', 'gif', 'tiff'))
+
+# Decode limit for the viewer: anything whose decoded size exceeds the budget is
+# downscaled to fit the maximum dimension
+_MAX_DECODE_DIMENSION = 2048
+_DECODE_BUDGET_BYTES = _MAX_DECODE_DIMENSION * _MAX_DECODE_DIMENSION * 4
+
+# Square thumbnails saved on disk at the largest grid size; smaller sizes are rendered from them
+_THUMBNAIL_DIR = os.path.join(project_root, 'user_data', 'thumbnails')
+_THUMBNAIL_SIZE = 400
+_THUMBNAIL_VERSION = 4  # Bump when the way thumbnails are made or named changes, so old files are not reused
+_THUMBNAIL_CACHE_DIR = os.path.join(_THUMBNAIL_DIR, f"{_THUMBNAIL_SIZE}_v{_THUMBNAIL_VERSION}")
+_THUMBNAIL_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Oldest thumbnails are deleted beyond this
+_STALE_TEMP_SECONDS = 3600  # Temporary files this old were left behind by an interrupted write
+
+# Metadata keys worth showing in the info panel; the full dict is behind the Details button
+_DISPLAY_KEYS = ('format', 'mode', 'Make', 'Model', 'DateTime')
+
+# Longer metadata values are cut short so huge blobs don't slow down text layout
+_MAX_METADATA_VALUE_LENGTH = 200
+
+# Maximum number of differing dHash bits for two same-size images to count as duplicates
+_DUPLICATE_HASH_DISTANCE = 5
+
+
+def _read_image(image_path, max_size=None):
+    """Decode an image into a QImage, downscaling images larger than the decode budget.
+
+    If max_size is given, the image is decoded directly at a size that fits in a
+    max_size x max_size box, which lets JPEG skip most of the full-size decode.
+    """
+    reader = QImageReader(image_path)
+    reader.setAutoTransform(True)  # Apply the EXIF orientation
+    size = reader.size()
+    if size.isValid() and max_size and (size.width() > max_size or size.height() > max_size):
+        reader.setScaledSize(size.scaled(max_size, max_size, Qt.KeepAspectRatio))
+    elif size.isValid() and size.width() * size.height() * 4 > _DECODE_BUDGET_BYTES:
+        reader.setScaledSize(size.scaled(_MAX_DECODE_DIMENSION, _MAX_DECODE_DIMENSION, Qt.KeepAspectRatio))
+
+    image = reader.read()
+    if image.isNull():
+        print(f"Skipping image {image_path}: {reader.errorString()}")
+    return image
+
+
+# Stylesheets, built once and shared by every instance
+_DRAGDROP_QSS = """
+    QFrame {
+        border: 2px dashed gray;
+        border-radius: 5px;
+        background-color: none;
+        font: bold 12px;
+        color: #555;
+        text-align: center;
+    }
+"""
+_DRAGDROP_LABEL_QSS = "font-size: 20px; color: #e0e0e0;border: none;"
+
+# The tag and size group boxes only differ in their padding
+_GROUP_BOX_QSS = """
+    QGroupBox {
+        font: bold 12px;
+        border: 2px solid gray;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding: %s;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 3px;
+    }
+"""
+# The tag buttons' font is styled once through their group box rather than per button
+_TAG_GROUP_QSS = _GROUP_BOX_QSS % '3px' + "QRadioButton { font-size: 11px; }\n"
+_SIZE_GROUP_QSS = _GROUP_BOX_QSS % '1px'
+
+
+def _thumb_path(image_path, stat):
+    """Return the disk cache path of an image's thumbnail; a modified or replaced file gets a new name."""
+    source = f"{os.path.abspath(image_path)}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8', 'surrogateescape')
+    if xxhash is not None:
+        key = xxhash.xxh3_128_hexdigest(source)
+    else:
+        key = hashlib.blake2s(source, digest_size=16).hexdigest()  # Same 32-character name as MD5, faster
+    return os.path.join(_THUMBNAIL_CACHE_DIR, f"{key}.png")
+
+
+def _thumb_key(image_path, size):
+    """Return the QPixmapCache key of an image at a size; a modified file gets a new key."""
+    try:
+        mtime_ns = os.stat(image_path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return f"{image_path}:{mtime_ns}:{size}"
+
+
+def _load_thumbnail(image_path):
+    """Load an image's square thumbnail from the disk cache, creating it on a miss."""
+    # The name only matches while the source keeps the mtime and size it had when the thumbnail was made
+    try:
+        thumb_path = _thumb_path(image_path, os.stat(image_path))
+    except OSError:
+        thumb_path = None  # The decode below fails and reports why
+    if thumb_path is not None and os.path.exists(thumb_path):
+        thumbnail = QImage(thumb_path)
+        if not thumbnail.isNull():
+            return thumbnail
+
+    # Let the decoder scale down while decoding so the full-size image is never built
+    reader = QImageReader(image_path)
+    reader.setAutoTransform(True)  # Apply the EXIF orientation
+    reader.setQuality(25)  # Favour decode speed over scaling quality for small thumbnails
+    size = reader.size()
+    if size.isValid():
+        # Only decode the center square, straight at thumbnail size (never upscaled).
+        # Formats whose plugin can't clip are clipped by QImageReader after decoding.
+        side = min(size.width(), size.height())
+        reader.setClipRect(QRect((size.width() - side) // 2, (size.height() - side) // 2, side, side))
+        target = min(side, _THUMBNAIL_SIZE)
+        reader.setScaledSize(QSize(target, target))
+    image = reader.read()
+    if image.isNull():
+        print(f"Skipping image {image_path}: {reader.errorString()}")
+        return image
+
+    # Keep the center square (only needed when the size couldn't be read up front)
+    side = min(image.width(), image.height())
+    if image.width() == image.height():
+        thumbnail = image
+    else:
+        thumbnail = image.copy((image.width() - side) // 2, (image.height() - side) // 2, side, side)
+
+    # Write to a temporary file first so a half-written thumbnail is never picked up. Each write
+    # gets its own file, as two pool threads can make the same thumbnail after a folder reload.
+    if thumb_path is None:
+        return thumbnail
+    try:
+        thumb_dir = os.path.dirname(thumb_path)
+        os.makedirs(thumb_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=thumb_dir)
+        os.close(fd)
+        if thumbnail.save(temp_path, "PNG"):
+            os.replace(temp_path, thumb_path)
+        else:
+            os.remove(temp_path)
+    except OSError as e:
+        print(f"Could not cache thumbnail for {image_path}: {e}")
+    return thumbnail
+
+
+def _prune_thumbnail_cache(max_bytes=_THUMBNAIL_CACHE_MAX_BYTES):
+    """Delete thumbnails of older versions, stale temporary files, and the oldest thumbnails beyond max_bytes."""
+    current_dir = _THUMBNAIL_CACHE_DIR
+    try:
+        with os.scandir(_THUMBNAIL_DIR) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and entry.path != current_dir:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+
+        thumbnails = []
+        total = 0
+        stale_before = time.time() - _STALE_TEMP_SECONDS
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                    if entry.name.endswith('.tmp'):
+                        if stat.st_mtime < stale_before:
+                            os.remove(entry.path)
+                    elif entry.name.endswith('.png'):
+                        thumbnails.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+                except OSError:
+                    continue  # Replaced or removed by a thumbnail job meanwhile
+    except OSError:
+        return  # Nothing cached yet
+
+    # An edited or replaced image gets a new thumbnail file, so the oldest files are the likeliest to be unused
+    thumbnails.sort()
+    for _, size, path in thumbnails:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=512)
+def _cached_metadata(image_path, mtime):
+    """Read an image's metadata once per (path, mtime); callers must not modify the result."""
+    if hasattr(Get_MetaData, 'get_image_metadata'):
+        return Get_MetaData.get_image_metadata(image_path)
+    return {
+        "filename": os.path.basename(image_path),
+        "size": os.path.getsize(image_path),
+        "path": image_path
+    }
+
+
+def _elide(value, limit=_MAX_METADATA_VALUE_LENGTH):
+    """Return the text of a metadata value, cut short with an ellipsis if it is too long."""
+    text = value if isinstance(value, str) else repr(value)
+    if len(text) > limit:
+        return text[:limit] + '…'
+    return text
+
+
+@lru_cache(maxsize=512)
+def _cached_metadata_text(image_path, mtime):
+    """Return the full metadata of an image formatted for the details box."""
+    metadata = _cached_metadata(image_path, mtime)
+    if isinstance(metadata, dict):
+        # Binary blobs like MakerNote can be tens of KB; keep them to a single line
+        metadata = {key: _elide(value) for key, value in metadata.items()}
+    return pformat(metadata, indent=2, compact=True, width=80)
+
+
+@lru_cache(maxsize=512)
+def _cached_quality(image_path, mtime):
+    """Run the quality check once per (path, mtime)."""
+    return check_image_quality(image_path)
+
 
 class DragDropArea(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)  # Enable drag-and-drop
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed gray;
-                border-radius: 5px;
-                background-color: none;
-                font: bold 12px;
-                color: #555;
-                text-align: center;
-            }
-        """)
+        self.setStyleSheet(_DRAGDROP_QSS)
         self.setFixedWidth(291)  # Set a fixed width for the drag-and-drop area
         self.setFixedHeight(100)  # Set a fixed height for the drag-and-drop area
 
         # Add a QLabel to display the text
         self.label = QLabel("Drag and Drop Folder Here", self)
         self.label.setAlignment(Qt.AlignCenter)  # Center the text
-        self.label.setStyleSheet("font-size: 20px; color: #e0e0e0;border: none;")  # Style the text
+        self.label.setStyleSheet(_DRAGDROP_LABEL_QSS)  # Style the text
 
         # Use a layout to center the label inside the frame
         layout = QVBoxLayout(self)
@@ -195,14 +437,6 @@ class DragDropArea(QFrame):
                 if os.path.isdir(folder_path):  # Check if the dropped item is a folder
                     print(f"Dropped folder: {folder_path}")
                     
-                    # Get all files in the directory
-                    try:
-                        img_files = get_all_files_in_directory.get_all_files_in_directory(folder_path)
-                        print(f"File list in folder: {len(img_files)} files")
-                    except:
-                        img_files = []
-                        print("Could not get file list")
-                    
                     # Update the parent window's image directory and refresh the grid
                     parent_window = self.parent()
                     while parent_window and not isinstance(parent_window, ImageWindow):
@@ -219,6 +453,98 @@ class DragDropArea(QFrame):
             event.ignore()
 
 
+class DeleteWorker(QThread):
+    """Worker thread that deletes a batch of files off the GUI thread"""
+    deleted = Signal(list, int)  # Deleted paths, number of failures
+
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+
+    def run(self):
+        """Delete every file, sending it to the trash when possible"""
+        deleted_paths = []
+        error_count = 0
+        for path in self.paths:
+            try:
+                if send2trash is not None:
+                    send2trash(path)
+                else:
+                    os.unlink(path)
+                deleted_paths.append(path)
+                print(f"Deleted: {path}")
+            except Exception as e:
+                error_count += 1
+                print(f"Failed to delete {path}: {e}")
+        self.deleted.emit(deleted_paths, error_count)
+
+
+class DuplicateScanWorker(QThread):
+    """Worker thread that finds duplicate images off the GUI thread"""
+    found = Signal(dict)  # Original path -> list of duplicate paths
+    error = Signal(str)
+
+    def __init__(self, image_files, hash_cache, file_sizes=None):
+        super().__init__()
+        self.image_files = image_files
+        self.hash_cache = hash_cache
+        self.file_sizes = file_sizes
+
+    def run(self):
+        try:
+            if hasattr(file_utils, 'build_duplicate_map'):
+                # Size buckets confirmed by perceptual hash, computed once per file
+                duplicates = file_utils.build_duplicate_map(self.image_files, _DUPLICATE_HASH_DISTANCE,
+                                                            self.hash_cache, self.file_sizes)
+            else:
+                # Fall back to grouping images by file size only
+                file_sizes = self.file_sizes or {}
+                size_groups = {}
+                for img_path in self.image_files:
+                    try:
+                        size = file_sizes.get(img_path)
+                        if size is None:
+                            size = os.path.getsize(img_path)
+                        size_groups.setdefault(size, []).append(img_path)
+                    except:
+                        continue
+                duplicates = {group[0]: group[1:] for group in size_groups.values() if len(group) > 1}
+            self.found.emit(duplicates)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class ThumbnailSignals(QObject):
+    """Signals for thumbnail jobs (QRunnable can't emit signals itself)"""
+    loaded = Signal(str, QImage, QImage, int)  # Image path, square base image (null on failure), grid-size image, grid size
+
+
+class ThumbnailJob(QRunnable):
+    """Load one image's thumbnail on a thread pool thread"""
+
+    def __init__(self, image_path, target_size, signals):
+        super().__init__()
+        self.image_path = image_path
+        self.target_size = target_size  # Grid label size when the job was queued
+        self.signals = signals
+
+    def run(self):
+        # QImage is safe to create off the GUI thread, QPixmap is not
+        image = _load_thumbnail(self.image_path)
+        if not image.isNull():
+            # Convert to the format the raster QPixmap uses here, so QPixmap.fromImage
+            # on the GUI thread is a plain copy instead of a per-pixel conversion
+            if image.hasAlphaChannel():
+                image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+            else:
+                image = image.convertToFormat(QImage.Format_RGB32)
+        # Scale the square thumbnail to the grid size here too, so the GUI thread only has to wrap it
+        scaled = QImage()
+        if not image.isNull() and image.width() != self.target_size:
+            scaled = image.scaled(self.target_size, self.target_size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        self.signals.loaded.emit(self.image_path, image, scaled, self.target_size)
+
+
 class ClickableLabel(QLabel):
     clicked = Signal()  # Define a custom signal
     doubleClicked = Signal()  # Define a custom signal for double click
@@ -233,6 +559,9 @@ class ClickableLabel(QLabel):
 
 
 class ImageWindow(QMainWindow):
+    _ICON_PATH = Path(__file__).resolve().parents[2] / 'resources' / 'icons' / 'ab_logo.svg'
+    _APP_ICON = None  # Shared by every window, created with the first one
+
     def __init__(self, image_dir):
         super().__init__()
         self.setWindowTitle("Album Vision+ - Smart Image Organization")
@@ -242,14 +571,53 @@ class ImageWindow(QMainWindow):
 
         # Initialize essential attributes early
         self.img_info = None
+        self._last_metadata_key = None  # (path, mtime) of the last clicked image
         self.tool_tips = None
-        self.image_labels = []
+        self.image_labels = {}  # Grid entries [label, loaded] keyed by image path, in grid order
+        self._image_sizes = {}  # File sizes in bytes keyed by path, captured while listing the folder
+        self._dir_cache = {}  # Folder path -> (mtime_ns, image paths) from the last scan
+        self._image_keys = {}  # Image path -> "path:mtime_ns" prefix of its pixmap cache keys
+        self._image_hashes = {}  # Perceptual hashes keyed by path, filled lazily
+        self._rough_thumbnails = []  # Paths shown with a fast-scaled thumbnail, re-rendered smoothly when idle
+        self._rough_size = 260
+
+        # Smooth re-render runs once the user has stopped switching sizes for a moment
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(150)
+        self._smooth_timer.timeout.connect(self.smooth_rough_thumbnails)
+        self._current_size = "Medium"
+        self._delete_worker = None
+        self._duplicate_worker = None
+        self._pending_thumbnails = {}  # Grid entries still waiting for their decoded image, keyed by path
+        self._queued_thumbnails = set()  # Pending paths already handed to the thread pool
+        self._failed_thumbnails = []  # Paths that couldn't be decoded, waiting to be removed from the grid
+
+        # Unreadable images are removed together, so the grid reflows once instead of once per file
+        self._failed_timer = QTimer(self)
+        self._failed_timer.setSingleShot(True)
+        self._failed_timer.setInterval(100)
+        self._failed_timer.timeout.connect(self.remove_failed_thumbnails)
+
+        # Only images near the visible part of the grid are decoded; scrolling queues more
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(50)  # Coalesce fast scrolling into one refresh
+        self._visible_timer.timeout.connect(self.queue_visible_thumbnails)
+
+        # Decode thumbnails on a thread pool so loading a folder doesn't block the UI
+        self._thumbnail_pool = QThreadPool(self)
+        self._thumbnail_pool.setMaxThreadCount(os.cpu_count() or 4)
+        self._thumbnail_signals = ThumbnailSignals(self)
+        self._thumbnail_signals.loaded.connect(self._on_thumbnail_loaded)
+        self._thumbnail_pool.start(_prune_thumbnail_cache)  # Keep the disk cache bounded, off the GUI thread
         self.button_group = QButtonGroup(self)
 
-        # Set the window icon
-        icon_path = os.path.join(os.path.dirname(__file__), '..', '..', 'resources', 'icons', 'ab_logo.svg')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        # Set the window icon (the SVG is only parsed once)
+        if ImageWindow._APP_ICON is None and ImageWindow._ICON_PATH.exists():
+            ImageWindow._APP_ICON = QIcon(str(ImageWindow._ICON_PATH))
+        if ImageWindow._APP_ICON is not None:
+            self.setWindowIcon(ImageWindow._APP_ICON)
 
         # Main container widget
         main_widget = QWidget(self)
@@ -285,33 +653,16 @@ class ImageWindow(QMainWindow):
 
         # Create a QGroupBox for the tag buttons
         tag_btn_group_box = QGroupBox("Tag Name")
-        tag_btn_group_box.setStyleSheet("""
-            QGroupBox {
-                font: bold 12px;
-                border: 2px solid gray;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding: 3px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 3px;
-            }
-        """)
+        tag_btn_group_box.setStyleSheet(_TAG_GROUP_QSS)
 
         # Add a horizontal layout for the image control widgets (above image area)
         img_ctrl_layout = QHBoxLayout()
 
         tab_btn_layout = QHBoxLayout()
 
-        btn_name_list = ['Animal', 'Cat', 'Dog', 'Person', 'Vehicle', 'Kitchenware', 'Appliance', 'Entertainment\n Device']
-        sorted_list = sorted(btn_name_list)  # Sorts alphabetically
-        sorted_list.append('Unknown')
-        for name in sorted_list:
+        for tag_id, name in enumerate(_TAG_NAMES):
             button = QRadioButton(f"{name}", self)
-            button.setStyleSheet("font-size: 11px;")  # Set font size for the button
-            self.button_group.addButton(button)  # Add the button to the group
+            self.button_group.addButton(button, tag_id)  # Add the button to the group, id = index in _TAG_NAMES
             tab_btn_layout.addWidget(button)
             button.installEventFilter(self)  # Install event filter for the button
 
@@ -323,20 +674,7 @@ class ImageWindow(QMainWindow):
 
         # Create another QGroupBox for the size control radio buttons
         size_group_box = QGroupBox("Image Size Control")
-        size_group_box.setStyleSheet("""
-            QGroupBox {
-                font: bold 12px;
-                border: 2px solid gray;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding: 1px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 3px;
-            }
-        """)
+        size_group_box.setStyleSheet(_SIZE_GROUP_QSS)
 
         # Add a horizontal layout for the radio buttons
         size_layout = QHBoxLayout()
@@ -354,10 +692,12 @@ class ImageWindow(QMainWindow):
         # Set default selection to Medium
         self.medium_size_btn.setChecked(True)
 
-        # Connect the radio buttons to the update_image_sizes function
-        self.small_size_btn.toggled.connect(lambda: self.update_image_sizes("Small"))
-        self.medium_size_btn.toggled.connect(lambda: self.update_image_sizes("Medium"))
-        self.large_size_btn.toggled.connect(lambda: self.update_image_sizes("Large"))
+        # Group the size buttons so a single handler sees each change once
+        self.size_button_group = QButtonGroup(self)
+        self.size_button_group.addButton(self.small_size_btn, 0)
+        self.size_button_group.addButton(self.medium_size_btn, 1)
+        self.size_button_group.addButton(self.large_size_btn, 2)
+        self.size_button_group.idClicked.connect(self.on_size_clicked)
 
         # Add the radio buttons to the layout
         size_layout.addWidget(self.small_size_btn)
@@ -381,6 +721,8 @@ class ImageWindow(QMainWindow):
         self.scroll_area = QScrollArea(self)
         self.scroll_area.setWidget(self.container_widget)
         self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._visible_timer.start)
+        self.scroll_area.viewport().installEventFilter(self)  # A bigger viewport brings more labels into view
         left_layout.addWidget(self.scroll_area, 1)
 
         left_widget = QWidget(self)
@@ -400,6 +742,11 @@ class ImageWindow(QMainWindow):
         self.img_info.setStyleSheet("border: 1px solid gray; padding: 10px; background-color: #f0f0f0;")
         info_layout.addWidget(self.img_info, 4)
 
+        self.details_bnt = QPushButton("Details", self)
+        self.details_bnt.setEnabled(False)
+        self.details_bnt.clicked.connect(self.show_metadata_details)
+        info_layout.addWidget(self.details_bnt)
+
         self.tool_tips = QLabel(self)
         self.tool_tips.setText("Tool Tips\n\nHover over buttons and controls to see helpful information.")
         self.tool_tips.setWordWrap(True)
@@ -429,50 +776,61 @@ class ImageWindow(QMainWindow):
         """Load images from a directory and populate the grid."""
         self.image_dir = directory
         
-        # Clear existing images
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.setParent(None)
+        self._image_hashes = {}
         
-        self.image_labels.clear()
+        # Collect the image files first
+        image_files, self._image_sizes, self._image_keys = self._scan_image_folder(directory)
         
-        # Load all image files from the directory
-        row = 0
-        col = 0
-        image_count = 0
+        # Drop decode jobs for the previous folder that haven't started yet
+        self._thumbnail_pool.clear()
+        self._pending_thumbnails = {}
+        self._queued_thumbnails = set()
+        self._failed_thumbnails = []
         
-        if os.path.exists(directory):
-            for file_name in os.listdir(directory):
-                if file_name.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff')):
-                    image_path = os.path.join(directory, file_name)
-                    try:
-                        image_label = ClickableLabel(self)
-                        pixmap = QPixmap(image_path)
-                        
-                        if not pixmap.isNull():
-                            crop_center = self.crop_center(pixmap)  # Crop the image to square
-                            image_label.setPixmap(crop_center)
-                            image_label.setScaledContents(True)
-                            image_label.setFixedSize(260, 260)  # Default size
-                            self.grid_layout.addWidget(image_label, row, col)
-                            self.image_labels.append((image_label, pixmap))  # Store label and pixmap
-                            image_label.installEventFilter(self)
-
-                            # Connect the clicked signal to a custom slot
-                            image_label.clicked.connect(lambda path=image_path: self.on_image_clicked(path))
-
-                            # Connect the doubleClicked signal to a custom slot
-                            image_label.doubleClicked.connect(lambda path=image_path: self.on_image_double_clicked(path))
-
-                            # Update column and row for the next image
-                            col += 1
-                            image_count += 1
-                            if col == 3:  # Move to the next row after 3 columns
-                                col = 0
-                                row += 1
-                    except Exception as e:
-                        print(f"Error loading image {image_path}: {e}")
+        # Fill the grid with placeholders right away; the real thumbnails arrive from the pool
+        placeholder = QPixmap(260, 260)
+        placeholder.fill(Qt.lightGray)
+        
+        self.image_labels = {}
+        
+        # Swap the whole grid with a single repaint instead of one per label
+        self.container_widget.setUpdatesEnabled(False)
+        try:
+            # Clear existing images
+            for i in reversed(range(self.grid_layout.count())):
+                widget = self.grid_layout.itemAt(i).widget()
+                if widget is not None:
+                    widget.setParent(None)
+
+            for i, image_path in enumerate(image_files):
+                image_label = ClickableLabel(self.container_widget)
+                image_label.setPixmap(placeholder)
+                image_label.setScaledContents(True)
+                image_label.setFixedSize(260, 260)  # Default size
+                row, col = divmod(i, 3)  # 3 columns
+                self.grid_layout.addWidget(image_label, row, col)
+                image_label.installEventFilter(self)
+
+                # Store the path on the label so every label can share one slot
+                image_label.setProperty("image_path", image_path)
+                image_label.clicked.connect(self._on_click_shared)
+                image_label.doubleClicked.connect(self._on_double_click_shared)
+
+                entry = [image_label, False]
+                self.image_labels[image_path] = entry
+
+                # Images still in the pixmap cache (e.g. a reopened folder) need no decoding at all
+                base = QPixmapCache.find(self._pixmap_key(image_path, "base"))
+                if base is not None:
+                    self._show_base_pixmap(entry, image_path, base)
+                else:
+                    # Queued by queue_visible_thumbnails once the label is near the viewport;
+                    # the pixmap is then filled in by _on_thumbnail_loaded
+                    self._pending_thumbnails[image_path] = entry
+        finally:
+            self.container_widget.setUpdatesEnabled(True)
+        self._visible_timer.start()  # Runs after the layout has placed the new labels
+        image_count = len(image_files)
         
         # Update the tool tips to show loaded image count
         if image_count > 0 and self.tool_tips:
@@ -480,8 +838,116 @@ class ImageWindow(QMainWindow):
         elif self.tool_tips:
             self.tool_tips.setText("No images found in the selected directory")
 
-    def update_image_sizes(self, size):
+    def _scan_image_folder(self, directory):
+        """List the images in a folder with their sizes and cache key prefixes, stat-ing each file once."""
+        if not os.path.exists(directory):
+            return [], {}, {}
+
+        image_sizes = {}
+        image_keys = {}
+
+        def remember(image_path, stat):
+            # Keep the size for the duplicate check's same-size pre-filter, and the mtime for
+            # the pixmap cache keys so size changes don't stat every file again
+            image_sizes[image_path] = stat.st_size
+            image_keys[image_path] = f"{image_path}:{stat.st_mtime_ns}"
+
+        # Adding, removing or renaming a file updates the folder's mtime
+        key = os.path.abspath(directory)
+        mtime_ns = os.stat(directory).st_mtime_ns
+        cached = self._dir_cache.get(key)
+        if cached is None or cached[0] != mtime_ns:
+            image_files = []
+            # scandir gives the entry type without an extra stat per file
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    # A name without a dot (e.g. a file called just 'png') has no extension
+                    name, sep, ext = entry.name.rpartition('.')
+                    if sep and ext.lower() in _IMAGE_EXT_SET:
+                        image_files.append(entry.path)
+                        try:
+                            remember(entry.path, entry.stat())
+                        except OSError:
+                            pass
+            self._dir_cache[key] = (mtime_ns, image_files)
+        else:
+            # Same file list, but an image may have been edited in place since the last scan
+            image_files = cached[1]
+            for image_path in image_files:
+                try:
+                    remember(image_path, os.stat(image_path))
+                except OSError:
+                    pass
+
+        # Hand out a copy so the grid can change it without touching the cache
+        return list(image_files), image_sizes, image_keys
+
+    def queue_visible_thumbnails(self):
+        """Start decoding the pending images within one screen of the visible part of the grid."""
+        if not self._pending_thumbnails:
+            return
+
+        # Visible band in grid coordinates, widened by a screen above and below for prefetching
+        viewport_height = self.scroll_area.viewport().height()
+        top = self.scroll_area.verticalScrollBar().value()
+        band = QRect(0, top - viewport_height, self.container_widget.width(), viewport_height * 3)
+
+        for image_path, entry in self._pending_thumbnails.items():
+            if image_path not in self._queued_thumbnails and entry[0].geometry().intersects(band):
+                self._queued_thumbnails.add(image_path)
+                self._thumbnail_pool.start(ThumbnailJob(image_path, entry[0].width(), self._thumbnail_signals))
+
+    def _on_thumbnail_loaded(self, image_path, image, scaled, target_size):
+        """Show a decoded image in its grid cell (runs on the GUI thread)."""
+        entry = self._pending_thumbnails.pop(image_path, None)
+        self._queued_thumbnails.discard(image_path)
+        if entry is None:
+            return  # Belongs to a folder that is no longer shown, or was removed
+
+        if image.isNull():
+            self._failed_thumbnails.append(image_path)
+            if not self._failed_timer.isActive():
+                self._failed_timer.start()  # Not restarted, so a steady stream of failures still gets removed
+            return
+
+        # Pixmaps live in QPixmapCache so memory stays bounded however large the folder is
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._pixmap_key(image_path, "base"), pixmap)
+        # Use the worker's grid-size copy unless the size changed while it was decoding
+        if not scaled.isNull() and entry[0].width() == target_size:
+            QPixmapCache.insert(self._pixmap_key(image_path, target_size), QPixmap.fromImage(scaled))
+        self._show_base_pixmap(entry, image_path, pixmap)
+
+    def remove_failed_thumbnails(self):
+        """Remove every image that failed to decode since the last call from the grid."""
+        paths, self._failed_thumbnails = self._failed_thumbnails, []
+        if paths:
+            self.remove_images(paths)
+
+    def _show_base_pixmap(self, entry, image_path, pixmap):
+        """Show an image's square source thumbnail in its grid label at the label's size."""
+        entry[1] = True
+        image_label = entry[0]
+        new_size = image_label.width()
+        key = self._pixmap_key(image_path, new_size)
+        thumbnail = QPixmapCache.find(key)
+        if thumbnail is None:
+            thumbnail = self.crop_center(pixmap, new_size)  # Crop the image to square
+            QPixmapCache.insert(key, thumbnail)
+        image_label.setPixmap(thumbnail)
+
+    def on_size_clicked(self, button_id):
+        """Resize the grid when a size button is clicked (fires once per click, unlike toggled)."""
+        self.update_image_sizes(_SIZE_NAMES[button_id])
+
+    def update_image_sizes(self, size, force=False):
         """Update the size of the images and grid layout based on the selected size."""
+        # Clicking the size that is already checked changes nothing
+        if size == self._current_size and not force:
+            return
+
         if size == "Small":
             new_size = 160  # Small size
             max_columns = 5  # 5 columns
@@ -491,76 +957,145 @@ class ImageWindow(QMainWindow):
         elif size == "Large":
             new_size = 400  # Large size
             max_columns = 2  # 2 columns
+        self._current_size = size
+
+        self._rough_thumbnails = []  # Every label is redrawn below
+        self._rough_size = new_size
 
-        # Clear the current grid layout
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.setParent(None)
-
-        # Re-add images to the grid layout with the new size and grid configuration
-        row = 0
-        col = 0
-        for image_label, pixmap in self.image_labels:
-            cropped_pixmap = self.crop_center(pixmap)
-            scaled_pixmap = cropped_pixmap.scaled(new_size, new_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            image_label.setPixmap(scaled_pixmap)
-            image_label.setFixedSize(new_size, new_size)
-
-            # Add the image label to the grid layout
-            self.grid_layout.addWidget(image_label, row, col)
-
-            # Update column and row for the next image
-            col += 1
-            if col == max_columns:  # Move to the next row after reaching max columns
-                col = 0
-                row += 1
+        # Move the existing labels to their new cells without detaching them from the window,
+        # and repaint once at the end instead of after every label
+        self.container_widget.setUpdatesEnabled(False)
+        try:
+            for i, (image_path, (image_label, loaded)) in enumerate(self.image_labels.items()):
+                # Images still decoding keep the placeholder, stretched to the new size
+                if loaded:
+                    # Thumbnails not cached at this size get a quick unfiltered render for now
+                    thumbnail = QPixmapCache.find(self._pixmap_key(image_path, new_size))
+                    if thumbnail is None:
+                        thumbnail = self.render_center_square(self._get_base_pixmap(image_path), new_size, smooth=False)
+                        self._rough_thumbnails.append(image_path)
+                    image_label.setPixmap(thumbnail)
+                image_label.setFixedSize(new_size, new_size)
+
+                # Re-slot the label in the grid layout
+                row, col = divmod(i, max_columns)
+                self.grid_layout.removeWidget(image_label)
+                self.grid_layout.addWidget(image_label, row, col)
+        finally:
+            self.container_widget.setUpdatesEnabled(True)
+
+        if self._rough_thumbnails:
+            self._smooth_timer.start()  # Restarts the wait if the user is still switching sizes
+        self._visible_timer.start()  # A different size brings other labels into view
+
+    def smooth_rough_thumbnails(self):
+        """Replace the fast-scaled thumbnails with smooth ones and cache them."""
+        new_size = self._rough_size
+        for image_path in self._rough_thumbnails:
+            entry = self.image_labels.get(image_path)
+            if entry is None:
+                continue  # Removed in the meantime
+            key = self._pixmap_key(image_path, new_size)
+            thumbnail = QPixmapCache.find(key)
+            if thumbnail is None:
+                thumbnail = self.render_center_square(self._get_base_pixmap(image_path), new_size)
+                QPixmapCache.insert(key, thumbnail)
+            entry[0].setPixmap(thumbnail)
+        self._rough_thumbnails = []
+
+    def _pixmap_key(self, image_path, size):
+        """Return the QPixmapCache key of an image at a size from the prefix built by the folder scan."""
+        prefix = self._image_keys.get(image_path)
+        if prefix is None:
+            return _thumb_key(image_path, size)  # Not from the scan, stat the file
+        return f"{prefix}:{size}"
+
+    def _get_base_pixmap(self, image_path):
+        """Return the square source thumbnail of an image, reloading it if the cache evicted it."""
+        key = self._pixmap_key(image_path, "base")
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            # The disk thumbnail cache makes this a small PNG read
+            pixmap = QPixmap.fromImage(_load_thumbnail(image_path))
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def render_center_square(self, pixmap, target, smooth=True):
+        """Draw the center square of a QPixmap scaled to a new target x target QPixmap in a single pass."""
+        pixmap_width = pixmap.width()
+        pixmap_height = pixmap.height()
+        side = min(pixmap_width, pixmap_height)
+        source_rect = QRect((pixmap_width - side) // 2, (pixmap_height - side) // 2, side, side)
+
+        thumbnail = QPixmap(target, target)
+        thumbnail.fill(Qt.transparent)  # Keeps transparent sources transparent
+        painter = QPainter(thumbnail)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, smooth)  # Nearest-neighbour when not smooth
+        painter.drawPixmap(thumbnail.rect(), pixmap, source_rect)
+        painter.end()
+        return thumbnail
+
+    def _on_click_shared(self):
+        """Forward a click from any image label to on_image_clicked."""
+        self.on_image_clicked(self.sender().property("image_path"))
+
+    def _on_double_click_shared(self):
+        """Forward a double-click from any image label to on_image_double_clicked."""
+        self.on_image_double_clicked(self.sender().property("image_path"))
 
     def on_image_clicked(self, image_path):
         """Handle the image click event with enhanced metadata and quality info."""
         try:
-            # Get basic metadata
-            if hasattr(Get_MetaData, 'get_image_metadata'):
-                metadata = Get_MetaData.get_image_metadata(image_path)
-            else:
-                metadata = {
-                    "filename": os.path.basename(image_path),
-                    "size": os.path.getsize(image_path),
-                    "path": image_path
-                }
+            # One stat gives both the size shown below and the mtime the caches are keyed on
+            stat = os.stat(image_path)
+            mtime = stat.st_mtime
+            metadata = _cached_metadata(image_path, mtime)
             
             # Check image quality
-            quality, score, dimensions = check_image_quality(image_path)
+            quality, score, dimensions = _cached_quality(image_path, mtime)
             
             if isinstance(metadata, dict) and "error" in metadata:
                 self.img_info.setText(f"Error reading metadata:\n{metadata['error']}")
+                self._clear_metadata_details()
             else:
                 # Enhanced metadata display with quality information
-                info_text = f"File: {os.path.basename(image_path)}\n\n"
+                lines = [f"File: {os.path.basename(image_path)}", ""]
                 
                 # Basic file info
-                try:
-                    file_size = os.path.getsize(image_path)
-                    info_text += f"Size: {file_size:,} bytes\n"
-                    info_text += f"Path: {image_path}\n\n"
-                except:
-                    pass
+                lines.append(f"Size: {stat.st_size:,} bytes")
+                lines.append(f"Path: {image_path}")
+                lines.append("")
                 
                 # Quality analysis
-                info_text += "Quality Analysis:\n"
-                info_text += f"Quality: {quality.upper()}\n"
-                info_text += f"Score: {score:.2f}\n"
-                info_text += f"Dimensions: {dimensions[0]} x {dimensions[1]}\n\n"
+                lines.append("Quality Analysis:")
+                lines.append(f"Quality: {quality.upper()}")
+                lines.append(f"Score: {score:.2f}")
+                lines.append(f"Dimensions: {dimensions[0]} x {dimensions[1]}")
                 
-                # Additional metadata if available
-                if isinstance(metadata, dict) and len(metadata) > 3:
-                    info_text += "Additional Metadata:\n"
-                    for key, value in list(metadata.items())[:5]:  # Show first 5 items
-                        info_text += f"{key}: {value}\n"
+                # Only the display-worthy metadata keys
+                if isinstance(metadata, dict):
+                    extra = [f"{key}: {_elide(metadata[key])}" for key in _DISPLAY_KEYS if key in metadata]
+                    if extra:
+                        lines.append("")
+                        lines.append("Additional Metadata:")
+                        lines.extend(extra)
                 
-                self.img_info.setText(info_text)
+                self.img_info.setText("\n".join(lines))
+                self._last_metadata_key = (image_path, mtime)
+                self.details_bnt.setEnabled(isinstance(metadata, dict))
         except Exception as e:
             self.img_info.setText(f"Error processing image:\n{str(e)}")
+            self._clear_metadata_details()
+
+    def _clear_metadata_details(self):
+        """Forget the last clicked image so Details can't show metadata the panel no longer describes."""
+        self._last_metadata_key = None
+        self.details_bnt.setEnabled(False)
+
+    def show_metadata_details(self):
+        """Show the full metadata of the last clicked image."""
+        if self._last_metadata_key is not None:
+            QMessageBox.information(self, "Image Metadata", _cached_metadata_text(*self._last_metadata_key))
 
     def on_image_double_clicked(self, image_path):
         """Handle the image double-click event."""
@@ -572,14 +1107,11 @@ class ImageWindow(QMainWindow):
             layout = QVBoxLayout(dialog)
             
             image_label = QLabel(dialog)
-            pixmap = QPixmap(image_path)
+            # Decode straight to a size that fits in a reasonable window
+            max_size = 800
+            pixmap = QPixmap.fromImage(_read_image(image_path, max_size))
             
             if not pixmap.isNull():
-                # Scale the image to fit in a reasonable window size
-                max_size = 800
-                if pixmap.width() > max_size or pixmap.height() > max_size:
-                    pixmap = pixmap.scaled(max_size, max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                
                 image_label.setPixmap(pixmap)
                 image_label.setAlignment(Qt.AlignCenter)
             else:
@@ -599,17 +1131,22 @@ class ImageWindow(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open image: {str(e)}")
 
-    def crop_center(self, pixmap):
-        """Crop the center of a QPixmap to create a square crop based on the smaller dimension."""
+    def crop_center(self, pixmap, target):
+        """Scale a QPixmap to cover a target x target square and crop its center."""
         if pixmap.isNull():
             return pixmap
-            
-        pixmap_width = pixmap.width()
-        pixmap_height = pixmap.height()
-        crop_size = min(pixmap_width, pixmap_height)
-        x = (pixmap_width - crop_size) // 2
-        y = (pixmap_height - crop_size) // 2
-        return pixmap.copy(x, y, crop_size, crop_size)
+
+        # Square images (like the cached thumbnails) need no crop, and no scaling at the target size
+        if pixmap.width() == pixmap.height():
+            if pixmap.width() == target:
+                return pixmap
+            return pixmap.scaled(target, target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+        # Scale so the smaller dimension matches the target, then cut the square out of the middle
+        scaled = pixmap.scaled(target, target, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        x = (scaled.width() - target) // 2
+        y = (scaled.height() - target) // 2
+        return scaled.copy(x, y, target, target)
 
     def open_import_dialog(self):
         """Open a file explorer to select a folder and return the folder path."""
@@ -688,10 +1225,10 @@ class ImageWindow(QMainWindow):
 
     def get_selected_tag(self):
         """Get the currently selected tag from radio buttons."""
-        button = self.button_group.checkedButton()
-        if button:
-            return button.text().replace('\n', '_')  # Handle multi-line button text
-        return "Unknown"  # Default if no tag is selected
+        tag_id = self.button_group.checkedId()
+        if tag_id >= 0:
+            return _TAG_FOLDER_NAMES[tag_id]
+        return "Unknown"  # Default if no tag is selected (checkedId() is -1)
 
     def process_images_with_quality_check(self, image_files, output_path):
         """
@@ -773,6 +1310,10 @@ class ImageWindow(QMainWindow):
     def eventFilter(self, obj, event):
         """Enhanced event filter with updated tool tips."""
         try:
+            # Growing the grid's viewport can show labels without any scrolling
+            if event.type() == QEvent.Resize and hasattr(self, 'scroll_area') and obj == self.scroll_area.viewport():
+                self._visible_timer.start()
+
             # Check if tool_tips exists before using it
             if not hasattr(self, 'tool_tips') or self.tool_tips is None:
                 return super().eventFilter(obj, event)
@@ -803,7 +1344,7 @@ class ImageWindow(QMainWindow):
                     self.tool_tips.setText("Display images in large size (2x2 grid)")
                 elif isinstance(obj, QRadioButton):
                     self.tool_tips.setText(f"Filter images by {obj.text()} category")
-                elif hasattr(self, 'image_labels') and any(obj == label for label, _ in self.image_labels):
+                elif isinstance(obj, ClickableLabel):  # Only grid images use ClickableLabel
                     self.tool_tips.setText("Click for metadata and quality info, double-click to view larger")
                 elif isinstance(obj, DragDropArea):
                     self.tool_tips.setText("Drag and drop a folder here to import images")
@@ -817,40 +1358,44 @@ class ImageWindow(QMainWindow):
     def show_duplicates_dialog(self):
         """Launch a dialog to show and delete detected duplicate images."""
         try:
-            folder = self.image_dir
-            
-            # Get all files in the directory
-            try:
-                all_files = get_all_files_in_directory.get_all_files_in_directory(folder)
-            except:
-                all_files = [os.path.join(folder, f) for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
-            
-            image_files = [f for f in all_files if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.tiff'))]
+            # Reuse the images already listed by the grid instead of walking the folder again
+            image_files = list(self.image_labels)
             
             if not image_files:
                 QMessageBox.information(self, "No Images", "No image files found in the current directory.")
                 return
             
-            # Simple duplicate detection based on file size (fallback method)
-            duplicates = {}
-            size_map = {}
+            # Hash the images in a worker thread so the window stays responsive
+            self.checkDup_bnt.setEnabled(False)
+            if self.tool_tips:
+                self.tool_tips.setText("Checking for duplicate images...")
+            self._duplicate_worker = DuplicateScanWorker(list(image_files), dict(self._image_hashes),
+                                                         dict(self._image_sizes))
+            self._duplicate_worker.found.connect(
+                lambda duplicates, scanned=self.image_labels: self.on_duplicates_found(duplicates, scanned))
+            self._duplicate_worker.error.connect(self.on_duplicate_scan_error)
+            self._duplicate_worker.start()
             
-            for img_path in image_files:
-                try:
-                    file_size = os.path.getsize(img_path)
-                    if file_size in size_map:
-                        # Potential duplicate found
-                        original = size_map[file_size]
-                        if original not in duplicates:
-                            duplicates[original] = []
-                        duplicates[original].append(img_path)
-                    else:
-                        size_map[file_size] = img_path
-                except:
-                    continue
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error checking for duplicates: {str(e)}")
+
+    def on_duplicate_scan_error(self, message):
+        """Report a failed duplicate scan."""
+        self.checkDup_bnt.setEnabled(True)
+        QMessageBox.warning(self, "Error", f"Error checking for duplicates: {message}")
+
+    def on_duplicates_found(self, duplicates, scanned):
+        """Show the duplicates found by the scan worker for review."""
+        self.checkDup_bnt.setEnabled(True)
+        if self.tool_tips:
+            self.tool_tips.setText("Tool Tips\n\nHover over buttons and controls to see helpful information.")
+        try:
+            # Keep the computed hashes unless another folder was loaded during the scan
+            if scanned is self.image_labels:
+                self._image_hashes.update(self._duplicate_worker.hash_cache)
             
             if not duplicates:
-                QMessageBox.information(self, "No Duplicates Found", "No duplicate images were found based on file size.")
+                QMessageBox.information(self, "No Duplicates Found", "No duplicate images were found based on file size and image content.")
                 return
                 
             dialog = QDialog(self)
@@ -888,30 +1433,48 @@ class ImageWindow(QMainWindow):
 
     def delete_selected_duplicates(self, dialog):
         """Delete files selected in the duplicate review dialog."""
-        deleted_count = 0
-        error_count = 0
-        
-        for cb in self.dup_checkboxes:
-            if cb.isChecked():
-                path = cb.property("file_path")
-                try:
-                    os.remove(path)
-                    deleted_count += 1
-                    print(f"Deleted: {path}")
-                except Exception as e:
-                    error_count += 1
-                    print(f"Failed to delete {path}: {e}")
-        
-        if deleted_count > 0:
+        paths = [cb.property("file_path") for cb in self.dup_checkboxes if cb.isChecked()]
+        if not paths:
+            QMessageBox.information(self, "No Action", "No files were selected for deletion.")
+            dialog.accept()
+            return
+
+        # Delete in a worker thread so large selections don't freeze the UI
+        dialog.setEnabled(False)
+        self._delete_worker = DeleteWorker(paths)
+        self._delete_worker.deleted.connect(
+            lambda deleted_paths, error_count: self.on_duplicates_deleted(dialog, deleted_paths, error_count))
+        self._delete_worker.start()
+
+    def on_duplicates_deleted(self, dialog, deleted_paths, error_count):
+        """Report the deletion result and drop the deleted images from the grid."""
+        if deleted_paths:
             QMessageBox.information(self, "Deletion Complete", 
-                                   f"Deleted {deleted_count} duplicate files.\n"
+                                   f"Deleted {len(deleted_paths)} duplicate files.\n"
                                    f"Errors: {error_count}")
-            self.refresh_image_grid()
+            self._dir_cache.pop(os.path.abspath(self.image_dir), None)
+            self.remove_images(deleted_paths)
         else:
             QMessageBox.information(self, "No Action", "No files were selected for deletion.")
         
         dialog.accept()
 
+    def remove_images(self, paths):
+        """Remove the given images from the grid without reloading the folder."""
+        for path in set(paths):
+            entry = self.image_labels.pop(path, None)
+            if entry is not None:
+                self.grid_layout.removeWidget(entry[0])
+                entry[0].deleteLater()
+            self._image_hashes.pop(path, None)
+            self._image_sizes.pop(path, None)
+            self._image_keys.pop(path, None)
+            self._pending_thumbnails.pop(path, None)
+            self._queued_thumbnails.discard(path)
+
+        # Reflow the remaining images into the grid at the current size
+        self.update_image_sizes(self._current_size, force=True)
+
 
 # Main execution block for testing
 if __name__ == "__main__":
@@ -1,36 +1,74 @@
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import cv2
 from ultralytics import YOLO
 
-#YOLOv8 model
-model = YOLO("yolov8n.pt")
+#YOLOv8 model, exported to ONNX once so later runs use the optimized runtime
+MODEL_PATH = "yolov8n.pt"
+
+def load_model():
+    pt_model = YOLO(MODEL_PATH)  #Resolves the weights file, downloading it if needed
+    try:
+        #The export is written next to the resolved weights, which may be Ultralytics' weights_dir
+        onnx_path = os.path.splitext(pt_model.ckpt_path or MODEL_PATH)[0] + ".onnx"
+        if not os.path.exists(onnx_path):
+            #dynamic=True keeps the batch size free so batched calls still work
+            onnx_path = pt_model.export(format="onnx", imgsz=640, dynamic=True)
+        return YOLO(onnx_path, task="detect")
+    except Exception as e:
+        print(f"Could not use the ONNX model, falling back to PyTorch: {e}")
+        return pt_model
+
+model = load_model()
 
 #Set folder path
 input_path = r"C:\Users\austi\OneDrive\Desktop\-BIG BAD FINAL PROJECT\REPO\AlbumVision\data\test_images"
-image_extensions = [".jpg", ".jpeg", ".png", ".webp"]
+image_extensions = (".jpg", ".jpeg", ".png", ".webp")  #Tuple so str.endswith can check them all at once
 
 #Store results
 sorted_images = defaultdict(list)
 
-def process_image(image_path):
-    filename = os.path.basename(image_path)
-    results = model(image_path, verbose=False)
+#Number of images sent to the model in one call
+BATCH_SIZE = 32
+
+def start_decoding(executor, image_paths):
+    # Queue the decodes on the pool threads (OpenCV releases the GIL while decoding)
+    return [(path, executor.submit(cv2.imread, path)) for path in image_paths]
 
-    labels = set()
-    for box in results[0].boxes:
-        cls_id = int(box.cls[0])
-        label = model.names[cls_id]
-        labels.add(label)
+def process_images(image_paths):
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        pending = start_decoding(executor, image_paths[:BATCH_SIZE])
+        for start in range(0, len(image_paths), BATCH_SIZE):
+            # Wait for this batch, skipping files OpenCV could not read
+            batch = [(path, future.result()) for path, future in pending]
+            batch = [(path, image) for path, image in batch if image is not None]
+            # Decode the following batch while the model runs on this one
+            pending = start_decoding(executor, image_paths[start + BATCH_SIZE:start + 2 * BATCH_SIZE])
+            if batch:
+                process_batch(batch)
 
-    for label in labels:
-        sorted_images[label].append(filename)
+def process_batch(batch):
+    results = model([image for _, image in batch], verbose=False)  # One forward pass for the whole batch
+
+    for (image_path, _), result in zip(batch, results):
+        filename = os.path.basename(image_path)
+        #Copy all class ids off the device in one call instead of once per box
+        cls_ids = result.boxes.cls.int().tolist()
+        labels = {model.names[cls_id] for cls_id in cls_ids}
+
+        for label in labels:
+            sorted_images[label].append(filename)
 
 #Confirm that it is a folder
 if os.path.isdir(input_path):
-    for filename in os.listdir(input_path):
-        if any(filename.lower().endswith(ext) for ext in image_extensions):
-            full_path = os.path.join(input_path, filename)
-            process_image(full_path)
+    image_paths = []
+    with os.scandir(input_path) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(image_extensions):
+                image_paths.append(entry.path)
+
+    process_images(image_paths)
 else:
     print("Invalid path provided. Make sure it's a directory.")
 
@@ -1,6 +1,9 @@
 from PIL import Image
 from PIL.ExifTags import TAGS
 
+#EXIF tag ids of the fields we show, e.g. 271 -> "Make"
+WANTED_TAGS = {tag_id: tag for tag_id, tag in TAGS.items() if tag in ["Make", "Model", "DateTime"]}
+
 def get_image_metadata(image_path):
     metadata = {}
 
@@ -10,12 +13,11 @@ def get_image_metadata(image_path):
             metadata["mode"] = img.mode
             metadata["size"] = img.size  #(width, height)
 
-            exif_data = img._getexif()
-            if exif_data:
-                for tag_id, value in exif_data.items():
-                    tag = TAGS.get(tag_id, tag_id)
-                    if tag in ["Make", "Model", "DateTime"]:
-                        metadata[tag] = value
+            #getexif() works for every format (empty if there is no EXIF), unlike the private _getexif()
+            exif_data = img.getexif()
+            for tag_id, tag in WANTED_TAGS.items():
+                if tag_id in exif_data:
+                    metadata[tag] = exif_data[tag_id]
 
             #defaults if not found
             for tag in ["Make", "Model", "DateTime"]:
@@ -1,20 +1,27 @@
 import sys
 import time
 
+#Filled cells and time of the last bar drawn, so unchanged bars are not redrawn
+_last_draw = {"filled": None, "time": 0.0}
+
 def print_progress_bar(iteration, total, prefix='', suffix='', length=50, fill='█'):
-    percent = f"{100 * (iteration / float(total)):.1f}"
     filled_length = int(length * iteration // total)
+    now = time.monotonic()
+    #Skip the redraw unless a cell flipped or 50 ms passed (always draw the last step)
+    if (iteration != total and filled_length == _last_draw["filled"]
+            and now - _last_draw["time"] < 0.05):
+        return
+    _last_draw["filled"] = filled_length
+    _last_draw["time"] = now
+
+    percent = f"{100 * (iteration / float(total)):.1f}"
     bar = fill * filled_length + '-' * (length - filled_length)
     sys.stdout.write(f'\r{prefix} |{bar}| {percent}% {suffix}')
     sys.stdout.flush()
     if iteration == total:
         print()
-        
-        import time
+        _last_draw["filled"] = None  #The next bar starts fresh
 
 for i in range(101):
     print_progress_bar(i, 100, prefix="Progress", suffix="Complete", length=40)
     time.sleep(0.05)
-    
-    
-     
\ No newline at end of file
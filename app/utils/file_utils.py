@@ -8,6 +8,9 @@ import sys
 import cv2
 import numpy as np
 import logging
+from PIL import Image
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 
 def filter_non_image_files(file_list):
@@ -24,11 +27,15 @@ def filter_non_image_files(file_list):
             - A list of strings that do not end with the specified extensions.
     """
     valid_extensions = ('jpg', 'png', 'webp')
-    filtered_list = [file for file in file_list if isinstance(file, str)]
-    non_image_files = [
-        file for file in filtered_list 
-        if not file.lower().endswith(valid_extensions)
-    ]
+    filtered_list = []
+    non_image_files = []
+    # One pass: keep every string, and note the ones without an image extension
+    for file in file_list:
+        if not isinstance(file, str):
+            continue
+        filtered_list.append(file)
+        if not file[-4:].lower().endswith(valid_extensions):  # Only the tail needs lowercasing
+            non_image_files.append(file)
     return filtered_list, non_image_files
 
 
@@ -43,12 +50,45 @@ def get_all_files_in_directory(directory):
         list: A list of file paths as strings.
     """
     file_list = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            file_list.append(os.path.join(root, file))
+    pending = [directory]  # Folders still to list, next one last
+    while pending:
+        folder = pending.pop()
+        subfolders = []
+        try:
+            # scandir returns each entry's type with the listing, so no extra stat per file
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked folders
+                        if not entry.is_symlink():
+                            subfolders.append(entry.path)
+                    else:
+                        file_list.append(entry.path)
+        except OSError:
+            continue  # Unreadable folder, skipped like os.walk does
+        # Reversed so subfolders are visited in listing order, the same order as os.walk
+        pending.extend(reversed(subfolders))
     return file_list
 
 
+def _header_dimensions(image_path):
+    """
+    Read an image's width and height from its header without decoding the pixels.
+
+    Args:
+        image_path (str): Path to the image.
+
+    Returns:
+        frozenset: The {width, height} pair (unordered, since EXIF rotation may swap
+        them when the image is decoded), or None if the header could not be read.
+    """
+    try:
+        with Image.open(image_path) as img:
+            return frozenset(img.size)
+    except Exception:
+        return None
+
+
 def find_duplicate_images(input_image_path, folder_path):
     """
     Check for duplicate images in a folder compared to the input image.
@@ -66,31 +106,142 @@ def find_duplicate_images(input_image_path, folder_path):
     if input_image is None:
         raise ValueError("The input image path is invalid or the image could not be loaded.")
 
-    duplicates = []
+    input_dimensions = frozenset(input_image.shape[:2])
 
-    # Iterate through all files in the folder
+    # Collect the candidate images first
+    candidates = []
     for filename in os.listdir(folder_path):
         file_path = os.path.join(folder_path, filename)
 
         # Skip if the file is the input image itself or not an image
         if file_path == input_image_path or not filename.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.tiff')):
             continue
+        candidates.append(file_path)
+
+    def is_duplicate(file_path):
+        # Images of a different size can't be identical; the header tells us without a full decode
+        header_dimensions = _header_dimensions(file_path)
+        if header_dimensions is not None and header_dimensions != input_dimensions:
+            return False
 
         # Load the current image
         current_image = cv2.imread(file_path)
 
         if current_image is None:
-            continue
+            return False
 
         # Check if the dimensions of the images are the same
         if input_image.shape != current_image.shape:
-            continue
+            return False
+
+        # Compare the images pixel by pixel (cv2.subtract saturates at 0, so it missed pixels
+        # that were brighter in the current image)
+        return np.array_equal(input_image, current_image)
+
+    # Decode and compare on several threads; OpenCV and NumPy release the GIL while they work.
+    # map() keeps the folder order of the results
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        matches = executor.map(is_duplicate, candidates)
+        duplicates = [file_path for file_path, match in zip(candidates, matches) if match]
+
+    return duplicates
+
+def compute_dhash(image_path):
+    """
+    Compute a 64-bit difference hash (dHash) for an image.
+
+    The image is decoded as grayscale, shrunk to 9x8 pixels and each bit of the
+    hash records whether a pixel is brighter than its right-hand neighbour.
+    Visually identical images produce hashes with a small Hamming distance.
+
+    Args:
+        image_path (str): Path to the image.
+
+    Returns:
+        int: The 64-bit hash, or None if the image could not be loaded.
+    """
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        return None
+
+    small = cv2.resize(image, (9, 8), interpolation=cv2.INTER_AREA)
+    diff = small[:, 1:] > small[:, :-1]  # 8x8 boolean mask computed in one vectorized pass
+    return int.from_bytes(np.packbits(diff).tobytes(), 'big')
+
+
+def hamming_distance(hash_a, hash_b):
+    """
+    Count the number of differing bits between two image hashes.
+
+    Args:
+        hash_a (int): First hash.
+        hash_b (int): Second hash.
+
+    Returns:
+        int: Number of bits that differ.
+    """
+    return bin(hash_a ^ hash_b).count('1')
 
-        # Compare the images pixel by pixel
-        difference = cv2.subtract(input_image, current_image)
-        if not np.any(difference):  # If no non-zero value in the difference, images are identical
-            duplicates.append(file_path)
 
+def build_duplicate_map(image_paths, max_distance=5, hash_cache=None, file_sizes=None):
+    """
+    Group duplicate images in a single pass over the file list.
+
+    Files are bucketed by size first, since only same-size files can be
+    duplicates. Only files that share a size are hashed (in parallel), and
+    each bucket is then split into groups whose dHashes are within
+    max_distance bits of the group's first image.
+
+    Args:
+        image_paths (list): Paths of the images to check.
+        max_distance (int): Maximum Hamming distance between duplicate hashes.
+        hash_cache (dict): Optional path -> hash dict reused between calls.
+            Missing hashes are computed and added to it.
+        file_sizes (dict): Optional path -> size in bytes, e.g. captured while
+            listing the folder. Paths missing from it are stat'ed.
+
+    Returns:
+        dict: Maps the first image of each duplicate group to a list of its duplicates.
+    """
+    if hash_cache is None:
+        hash_cache = {}
+
+    # Bucket by file size
+    if file_sizes is None:
+        file_sizes = {}
+    size_groups = defaultdict(list)
+    for path in image_paths:
+        size = file_sizes.get(path)
+        if size is None:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+        size_groups[size].append(path)
+
+    # Hash every candidate once; OpenCV releases the GIL while decoding
+    candidates = [path for group in size_groups.values() if len(group) > 1
+                  for path in group if path not in hash_cache]
+    if candidates:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for path, image_hash in zip(candidates, executor.map(compute_dhash, candidates)):
+                hash_cache[path] = image_hash
+
+    duplicates = {}
+    for group in size_groups.values():
+        if len(group) < 2:
+            continue
+        originals = []  # (path, hash) of the first image of each group in this bucket
+        for path in group:
+            image_hash = hash_cache.get(path)
+            if image_hash is None:
+                continue
+            for original, original_hash in originals:
+                if hamming_distance(original_hash, image_hash) <= max_distance:
+                    duplicates.setdefault(original, []).append(path)
+                    break
+            else:
+                originals.append((path, image_hash))
     return duplicates
 
 # Only for testing purposes
@@ -12,9 +12,13 @@ def filter_non_image_files(file_list):
             - A list of strings that do not end with the specified extensions.
     """
     valid_extensions = ('jpg', 'png', 'webp')
-    filtered_list = [file for file in file_list if isinstance(file, str)]
-    non_image_files = [
-        file for file in filtered_list 
-        if not file.lower().endswith(valid_extensions)
-    ]
+    filtered_list = []
+    non_image_files = []
+    # One pass: keep every string, and note the ones without an image extension
+    for file in file_list:
+        if not isinstance(file, str):
+            continue
+        filtered_list.append(file)
+        if not file[-4:].lower().endswith(valid_extensions):  # Only the tail needs lowercasing
+            non_image_files.append(file)
     return filtered_list, non_image_files
\ No newline at end of file
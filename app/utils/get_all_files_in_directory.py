@@ -11,7 +11,22 @@ def get_all_files_in_directory(directory):
         list: A list of file paths as strings.
     """
     file_list = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            file_list.append(os.path.join(root, file))
+    pending = [directory]  # Folders still to list, next one last
+    while pending:
+        folder = pending.pop()
+        subfolders = []
+        try:
+            # scandir returns each entry's type with the listing, so no extra stat per file
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked folders
+                        if not entry.is_symlink():
+                            subfolders.append(entry.path)
+                    else:
+                        file_list.append(entry.path)
+        except OSError:
+            continue  # Unreadable folder, skipped like os.walk does
+        # Reversed so subfolders are visited in listing order, the same order as os.walk
+        pending.extend(reversed(subfolders))
     return file_list
\ No newline at end of file
@@ -24,7 +24,9 @@ def main():
         from PySide6.QtWidgets import QApplication 
         from app.gui.main_window import ImageWindow 
         image_directory = r".\data\test_images"  # Replace with your directory path
+        from PySide6.QtGui import QPixmapCache 
         app = QApplication(sys.argv) # Create the application instance
+        QPixmapCache.setCacheLimit(512 * 1024)  # Thumbnail cache limit in KB (512 MB)
         window = ImageWindow(image_directory) # Create the main window instance
         window.setWindowTitle("Album Vision+")   # Set the window title
         window.show() 
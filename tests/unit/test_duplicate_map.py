@@ -0,0 +1,81 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.utils.file_utils import build_duplicate_map, compute_dhash, hamming_distance
+
+
+def save_gradient(path, reverse=False):
+    """Save a 64x64 horizontal gradient BMP; BMPs of the same size always have the same byte size."""
+    row = np.linspace(0, 255, 64, dtype=np.uint8)
+    if reverse:
+        row = row[::-1]
+    Image.fromarray(np.tile(row, (64, 1)), mode="L").convert("RGB").save(path)
+    return str(path)
+
+
+def test_hamming_distance():
+    assert hamming_distance(0b1011, 0b1011) == 0
+    assert hamming_distance(0b1011, 0b0010) == 2
+
+
+def test_compute_dhash_unreadable_file(tmp_path):
+    path = tmp_path / "broken.jpg"
+    path.write_bytes(b"not an image")
+    assert compute_dhash(str(path)) is None
+
+
+def test_exact_copy_is_duplicate(tmp_path):
+    original = save_gradient(tmp_path / "a.bmp")
+    copy = str(tmp_path / "b.bmp")
+    shutil.copy(original, copy)
+
+    assert build_duplicate_map([original, copy]) == {original: [copy]}
+
+
+def test_unrelated_file_of_same_size_is_not_duplicate(tmp_path):
+    first = save_gradient(tmp_path / "a.bmp")
+    second = save_gradient(tmp_path / "b.bmp", reverse=True)
+    assert os.path.getsize(first) == os.path.getsize(second)
+
+    assert build_duplicate_map([first, second]) == {}
+
+
+def test_unreadable_file_is_skipped(tmp_path):
+    image = save_gradient(tmp_path / "a.bmp")
+    broken = tmp_path / "b.bmp"
+    broken.write_bytes(b"\0" * os.path.getsize(image))  # Same size, so it gets hashed
+    hash_cache = {}
+
+    assert build_duplicate_map([image, str(broken)], hash_cache=hash_cache) == {}
+    assert hash_cache[str(broken)] is None
+
+
+def test_hash_cache_is_filled_and_reused(tmp_path):
+    first = save_gradient(tmp_path / "a.bmp")
+    second = save_gradient(tmp_path / "b.bmp", reverse=True)
+    hash_cache = {}
+    build_duplicate_map([first, second], hash_cache=hash_cache)
+    assert hash_cache == {first: compute_dhash(first), second: compute_dhash(second)}
+
+    # Cached hashes are used as they are, without decoding the files again
+    hash_cache = {first: 0, second: 0}
+    assert build_duplicate_map([first, second], hash_cache=hash_cache) == {first: [second]}
+
+
+def test_file_sizes_replace_stat(tmp_path):
+    # The files don't exist, so only the given sizes and hashes can be used
+    first = str(tmp_path / "a.bmp")
+    second = str(tmp_path / "b.bmp")
+    third = str(tmp_path / "c.bmp")
+    file_sizes = {first: 100, second: 100, third: 200}
+    hash_cache = {first: 0, second: 1, third: 0}
+
+    assert build_duplicate_map([first, second, third], 5, hash_cache, file_sizes) == {first: [second]}